@@ -0,0 +1,34 @@
+"""Numeric kernels for the Gap Killer; JIT-compiled with Numba when it is installed.
+
+Only PlayerWidget._probe_buffer uses these, and nothing feeds it buffers
+under Qt 6 yet (see PlayerWidget.on_buffer1).
+"""
+import math
+import numpy as np
+
+try:
+    from numba import njit
+except Exception:
+    njit = None
+
+
+def _mean_square(a):
+    # Single pass, no temporaries; Numba vectorizes the reduction
+    s = 0.0
+    for i in range(a.size):
+        x = float(a[i])
+        s += x * x
+    return s / a.size if a.size else 0.0
+
+
+if njit is not None:
+    mean_square = njit(cache=True, fastmath=True)(_mean_square)
+else:
+    def mean_square(a):
+        return float(np.mean(np.square(a, dtype=np.float64))) if a.size else 0.0
+
+
+def rms_db(a, scale: float) -> float:
+    """Level of sample array a in dBFS, with scale the format's full-scale value."""
+    rms = math.sqrt(mean_square(a)) / scale
+    return 20*math.log10(rms) if rms > 0 else -120
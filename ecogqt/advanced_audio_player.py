@@ -1,16 +1,134 @@
 import sys
 import os
-from PySide6.QtCore import Qt, QDate, QEvent, QUrl, Slot, QTimer, QSize, QRect
-from PySide6.QtGui import QPixmap, QTextCursor, QImage, QIcon
+import functools
+import hashlib
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from PySide6.QtCore import (
+    Qt, QDate, QEvent, QUrl, Slot, QTimer, QSize, QRect, QObject, QRunnable,
+    QThreadPool, Signal, QStandardPaths, QBuffer, QByteArray, QIODevice
+)
+from PySide6.QtGui import (
+    QPixmap, QTextCursor, QImage, QIcon, QTextBlockFormat, QTextCharFormat,
+    QColor, QFont
+)
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QSlider, QListWidget, QFileDialog, QTextEdit, QListWidgetItem, QMessageBox,
+    QSlider, QListWidget, QFileDialog, QTextEdit, QMessageBox,
     QGridLayout, QComboBox, QSpinBox, QFormLayout, QGroupBox
 )
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput, QMediaMetaData
 from mutagen import File
-from mutagen.flac import FLAC
+from operator import itemgetter
+import bisect
 import re
+try:
+    # google-re2 matches in linear time; the stdlib engine is the fallback
+    import re2 as _lrc_re
+except ImportError:
+    _lrc_re = re
+
+_TIME_TAG = _lrc_re.compile(r"\[(\d+):(\d+)(?:\.(\d+))?\]")
+# A run of one or more [mm:ss.xx] tags followed by the rest of the line,
+# which may hold brackets like "[chorus]" or further time tags
+_LRC_RE = _lrc_re.compile(r"((?:\[\d+:\d+(?:\.\d+)?\])+)([^\n\r]*)")
+# Enhanced LRC per-word <mm:ss.xx> stamps inside a line's text
+_WORD_TAG = _lrc_re.compile(r"<\d+:\d+(?:\.\d+)?>")
+_YEAR_RE = re.compile(r'\b(\d{4})\b')
+_LYRIC_KEYS = frozenset(('lyrics', 'unsyncedlyrics', 'lyric'))
+_ID3_LYRIC_FRAMES = frozenset(('USLT', 'SYLT'))
+# Zero-padded "00".."99" for format_time
+_TWO_DIGITS = [f"{i:02}" for i in range(100)]
+
+# Side of the square artwork is scaled into before it goes to the disk cache
+_ART_CACHE_SIZE = 256
+
+def _file_stamp(path):
+    """mtime|size of path, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns}|{st.st_size}"
+
+def _load_meta(path):
+    """Parse a file's tags with mutagen once per version of the file."""
+    return _parse_meta(path, _file_stamp(path))
+
+@functools.lru_cache(maxsize=64)
+def _parse_meta(path, stamp):
+    # stamp is only part of the key, so a retagged file is parsed again
+    try:
+        return File(path)
+    except Exception:
+        return None
+
+class MetaCache:
+    """On-disk cache of per-file lyrics, tags and artwork.
+
+    Entries are stamped with the file's mtime and size, so an edited file
+    simply misses. This only speeds up cold starts; the lru_caches stay the
+    hot path within a session.
+    """
+    def __init__(self, db_path=None):
+        self.db_path = db_path
+        self.conn = None
+        self.lock = threading.Lock()
+
+    def _connect(self):
+        if self.conn is None:
+            if self.db_path is None:
+                cache_dir = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+                os.makedirs(cache_dir, exist_ok=True)
+                self.db_path = os.path.join(cache_dir, "meta.db")
+            # Album art is looked up from QThreadPool workers as well
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta ("
+                "path TEXT, field TEXT, stamp TEXT, value BLOB, "
+                "PRIMARY KEY (path, field))")
+            # Full-size "art" entries from older versions; "thumb" replaces them
+            with self.conn:
+                self.conn.execute("DELETE FROM meta WHERE field = 'art'")
+        return self.conn
+
+    def get(self, path, field, stamp=None):
+        """Return the cached value of field for path, or None on a miss.
+
+        stamp defaults to the file's current one; pass the stamp the caller
+        read the file under to keep get and put consistent.
+        """
+        stamp = stamp or _file_stamp(path)
+        if stamp is None:
+            return None
+        try:
+            with self.lock:
+                row = self._connect().execute(
+                    "SELECT value FROM meta WHERE path = ? AND field = ? AND stamp = ?",
+                    (path, field, stamp)).fetchone()
+        except sqlite3.Error as e:
+            print("Metadata cache error:", e)
+            return None
+        return row[0] if row else None
+
+    def put(self, path, field, value, stamp=None):
+        stamp = stamp or _file_stamp(path)
+        if stamp is None:
+            return
+        try:
+            with self.lock:
+                conn = self._connect()
+                # Replaces any entry left over from an older version of the file
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES (?, ?, ?, ?)",
+                    (path, field, stamp, value))
+                conn.commit()
+        except sqlite3.Error as e:
+            print("Metadata cache error:", e)
+
+_meta_cache = MetaCache()
 
 class SynchronizedLyrics:
     def __init__(self, audio_path=None):
@@ -18,33 +136,42 @@ class SynchronizedLyrics:
         self.lines = []
         self.raw_lyrics = ""
         if audio_path:
-            lrc_path = os.path.splitext(audio_path)[0] + ".lrc"
-            if os.path.exists(lrc_path):
-                with open(lrc_path, encoding='utf-8') as f:
-                    self.raw_lyrics = f.read()
-            else:
-                self.raw_lyrics = self.get_embedded_lyrics(audio_path)
+            source = os.path.splitext(audio_path)[0] + ".lrc"
+            cached = _meta_cache.get(source, "lyrics")
+            if cached is None:
+                try:
+                    self.raw_lyrics = Path(source).read_text(encoding='utf-8')
+                except OSError:
+                    source = audio_path
+                    cached = _meta_cache.get(source, "lyrics")
+                    if cached is None:
+                        self.raw_lyrics = self.get_embedded_lyrics(audio_path)
+            if cached is not None:
+                entry = json.loads(cached)
+                self.raw_lyrics = entry["raw"]
+                self.times = entry["times"]
+                self.lines = entry["lines"]
+                return
             self.parse_lyrics(self.raw_lyrics)
+            _meta_cache.put(source, "lyrics", json.dumps(
+                {"raw": self.raw_lyrics, "times": self.times, "lines": self.lines}))
 
     def get_embedded_lyrics(self, audio_path):
-        audio = File(audio_path)
+        audio = _load_meta(audio_path)
         if audio is None:
             return ""
 
             # FLAC/Vorbis
         if audio.__class__.__name__ == 'FLAC':
-            for key in audio:
-                if key.lower() in ('lyrics', 'unsyncedlyrics', 'lyric'):
-                    return audio[key][0]
-            return ""
+            # Vorbis comment lookups are case-insensitive
+            hits = _LYRIC_KEYS.intersection(k.lower() for k in audio.keys())
+            return audio[next(iter(hits))][0] if hits else ""
 
             # MP3 (ID3)
         if hasattr(audio, 'tags') and audio.tags:
             # USLT (unsynchronized lyrics) is the standard for ID3
             for k in audio.tags.keys():
-                if k.startswith('USLT') or k.startswith('SYLT'):
-                    return str(audio.tags[k])
-                if k.lower() in ('lyrics', 'unsyncedlyrics', 'lyric'):
+                if k[:4] in _ID3_LYRIC_FRAMES or k.lower() in _LYRIC_KEYS:
                     return str(audio.tags[k])
             # MP4/AAC
         if hasattr(audio, 'tags') and hasattr(audio.tags, 'get'):
@@ -53,27 +180,32 @@ class SynchronizedLyrics:
         return ""
 
     def parse_lyrics(self, lyrics_text):
-        time_tag = re.compile(r"\[(\d+):(\d+)(?:\.(\d+))?\]")
-        self.times = []
-        self.lines = []
-        for line in lyrics_text.splitlines():
-            matches = list(time_tag.finditer(line))
-            if matches:
-                lyric = time_tag.sub('', line).strip()
-                for m in matches:
-                    min, sec, ms = m.groups()
-                    total_ms = int(min) * 60 * 1000 + int(sec) * 1000 + int(ms or 0)
-                    self.times.append(total_ms)
-                    self.lines.append(lyric)
-            elif line.strip():
-                self.times.append(0)
-                self.lines.append(line.strip())
+        pairs = []
+        for m in _LRC_RE.finditer(lyrics_text):
+            tags, lyric = m.group(1), m.group(2)
+            if "[" in lyric:
+                # Time tags later in the line still apply to the whole line
+                tags += "".join(t.group(0) for t in _TIME_TAG.finditer(lyric))
+                lyric = _TIME_TAG.sub("", lyric)
+            if "<" in lyric:
+                lyric = _WORD_TAG.sub("", lyric)
+            lyric = lyric.strip()
+            for tag in _TIME_TAG.finditer(tags):
+                min, sec, ms = tag.groups()
+                # Fractions are hundredths or thousandths: ".5" is 500 ms
+                ms = int((ms or "0").ljust(3, "0")[:3])
+                pairs.append((int(min) * 60 * 1000 + int(sec) * 1000 + ms, lyric))
+        if not pairs:
+            # Unsynchronized lyrics: show every non-empty line
+            pairs = [(0, line.strip()) for line in lyrics_text.splitlines() if line.strip()]
+        # Keep times sorted so get_current_line can binary search them
+        pairs.sort(key=itemgetter(0))
+        self.times = [t for t, _ in pairs]
+        self.lines = [l for _, l in pairs]
 
     def get_current_line(self, pos_ms):
-        for i, t in enumerate(self.times):
-            if pos_ms < t:
-                return max(0, i-1)
-        return len(self.lines)-1 if self.lines else -1
+        i = bisect.bisect_right(self.times, pos_ms) - 1
+        return i if i >= 0 else (0 if self.lines else -1)
 
     def is_synchronized(self):
         """Return True if lyrics are synchronized (have time tags)."""
@@ -88,40 +220,53 @@ class LyricsDisplay(QTextEdit):
         self.current_line_idx = -1
         self.lines = []
         self.is_synchronized = False
+        # Formats used to restyle single blocks instead of rebuilding the document
+        self.default_fmt = QTextBlockFormat()
+        self.default_char_fmt = QTextCharFormat()
+        self.highlight_fmt = QTextBlockFormat()
+        self.highlight_fmt.setBackground(QColor("#E0F0FF"))
+        self.highlight_char_fmt = QTextCharFormat()
+        self.highlight_char_fmt.setForeground(QColor("#3A89FF"))
+        self.highlight_char_fmt.setFontWeight(QFont.Bold)
 
     def set_lyrics(self, lines, is_synchronized):
         self.lines = lines
         self.is_synchronized = is_synchronized
         self.current_line_idx = -1
-        self.update_display(-1)
-
-    def update_display(self, highlight_idx):
-        html = ""
-        for idx, line in enumerate(self.lines):
-            if self.is_synchronized and idx == highlight_idx:
-                html += f"<div style='color: #3A89FF; font-weight: bold; background: #E0F0FF'>{line}</div>"
-            else:
-                html += f"<div>{line}</div>"
-        self.setHtml(html)
-        if self.is_synchronized and 0 <= highlight_idx < len(self.lines):
-            cursor = self.textCursor()
-            cursor.movePosition(QTextCursor.Start)
-            for _ in range(highlight_idx):
-                cursor.movePosition(QTextCursor.Down)
-            self.setTextCursor(cursor)
-            self.ensureCursorVisible()
+        # Populate the document once, one block per lyric line
+        self.clear()
+        cursor = QTextCursor(self.document())
+        for idx, line in enumerate(lines):
+            if idx:
+                cursor.insertBlock()
+            cursor.insertText(line)
+        self.moveCursor(QTextCursor.Start)
+
+    def format_block(self, idx, block_fmt, char_fmt):
+        block = self.document().findBlockByNumber(idx)
+        if not block.isValid():
+            return None
+        cursor = QTextCursor(block)
+        cursor.setBlockFormat(block_fmt)
+        cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+        cursor.setCharFormat(char_fmt)
+        return QTextCursor(block)
 
     def highlight_line(self, idx):
         # Only highlight if lyrics are synchronized
-        if self.is_synchronized:
-            if idx != self.current_line_idx:
-                self.current_line_idx = idx
-                self.update_display(idx)
-        else:
-            # For unsynchronized lyrics, never highlight any line
-            if self.current_line_idx != -1:
-                self.current_line_idx = -1
-                self.update_display(-1)
+        if not self.is_synchronized:
+            idx = -1
+        if idx == self.current_line_idx:
+            return
+        # Only the previous and the new active blocks are touched
+        if self.current_line_idx >= 0:
+            self.format_block(self.current_line_idx, self.default_fmt, self.default_char_fmt)
+        self.current_line_idx = idx
+        if 0 <= idx < len(self.lines):
+            cursor = self.format_block(idx, self.highlight_fmt, self.highlight_char_fmt)
+            if cursor is not None:
+                self.setTextCursor(cursor)
+                self.ensureCursorVisible()
 
 def split_image(image_path, tile_width, tile_height):
     image = QImage(image_path)
@@ -140,6 +285,109 @@ def split_image(image_path, tile_width, tile_height):
             sub_images.append(sub_img)
     return sub_images
 
+def _load_album_art(path, width, height):
+    """Return the embedded artwork of path decoded and scaled, or a null QImage."""
+    return _album_art(path, _file_stamp(path), width, height)
+
+@functools.lru_cache(maxsize=64)
+def _album_art(path, stamp, width, height):
+    img_data = _meta_cache.get(path, "thumb", stamp)
+    if img_data is None:
+        # Use mutagen to extract artwork robustly
+        audio = _parse_meta(path, stamp)
+        if audio is not None:
+            if hasattr(audio, 'tags'):
+                tags = audio.tags
+                # MP3: APIC
+                if 'APIC:' in tags:
+                    img_data = tags['APIC:'].data
+                # MP4/M4A: covr
+                elif hasattr(tags, 'get') and tags.get('covr'):
+                    img_data = tags['covr'][0]
+                # FLAC: pictures
+                elif hasattr(audio, 'pictures') and audio.pictures:
+                    img_data = audio.pictures[0].data
+        img_data = _art_thumbnail(img_data) if img_data else b""
+        # An empty entry records "no artwork" so mutagen is skipped next time
+        _meta_cache.put(path, "thumb", img_data, stamp)
+    if not img_data:
+        return QImage()
+    return _decode_album_art(img_data, width, height)
+
+def _art_thumbnail(img_data):
+    """PNG of the artwork scaled to fit _ART_CACHE_SIZE, or b"" if it won't decode."""
+    img = QImage.fromData(img_data)
+    if img.isNull():
+        return b""
+    if img.width() > _ART_CACHE_SIZE or img.height() > _ART_CACHE_SIZE:
+        img = img.scaled(_ART_CACHE_SIZE, _ART_CACHE_SIZE, Qt.KeepAspectRatio,
+                         Qt.SmoothTransformation)
+    data = QByteArray()
+    buf = QBuffer(data)
+    buf.open(QIODevice.WriteOnly)
+    img.save(buf, "PNG")
+    buf.close()
+    return bytes(data)
+
+# Scaled artwork by content, so tracks sharing a cover decode it only once
+_art_images = {}
+_art_images_lock = threading.Lock()
+
+def _decode_album_art(img_data, width, height):
+    key = (hashlib.blake2b(img_data, digest_size=8).digest(), width, height)
+    with _art_images_lock:
+        img = _art_images.get(key)
+    if img is None:
+        img = QImage.fromData(img_data).scaled(
+            width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        with _art_images_lock:
+            if len(_art_images) >= 64:
+                del _art_images[next(iter(_art_images))]
+            _art_images[key] = img
+    return img
+
+class ArtLoaderSignals(QObject):
+    finished = Signal(str, QImage)
+
+class ArtLoader(QRunnable):
+    """Load album art on a QThreadPool worker.
+
+    Only QImage is used here since QPixmap may not be created outside the
+    GUI thread; the receiver converts the result.
+    """
+    def __init__(self, path, width, height, signals):
+        super().__init__()
+        self.path = path
+        self.width = width
+        self.height = height
+        self.signals = signals
+
+    def run(self):
+        try:
+            img = _load_album_art(self.path, self.width, self.height)
+        except Exception as e:
+            print("Artwork extraction error:", e)
+            img = QImage()
+        self.signals.finished.emit(self.path, img)
+
+class PlaylistLoaderSignals(QObject):
+    loaded = Signal(int, list)
+
+class PlaylistLoader(QRunnable):
+    """Expand dropped files and .m3u/.cue playlists on a QThreadPool worker.
+
+    generation is passed back so results can be dropped after a clear.
+    """
+    def __init__(self, files, expand, generation, signals):
+        super().__init__()
+        self.files = files
+        self.expand = expand
+        self.generation = generation
+        self.signals = signals
+
+    def run(self):
+        self.signals.loaded.emit(self.generation, self.expand(self.files))
+
 class AudioPlayer(QWidget):
     def __init__(self):
         super().__init__()
@@ -149,9 +397,6 @@ class AudioPlayer(QWidget):
         self.current_index = -1
         self.show_remaining = False
         self.lyrics = None
-        self.lyrics_timer = QTimer(self)
-        self.lyrics_timer.setInterval(200)
-        self.lyrics_timer.timeout.connect(self.update_lyrics_display)
 
         # Mixing/transition config
         self.mix_method = "Fade"  # Default
@@ -164,6 +409,12 @@ class AudioPlayer(QWidget):
         self.player.setAudioOutput(self.audio_output)
         self.next_player = None  # For mixing with next track
         self.next_output = None
+        # Muted shadow player that opens the next track ahead of time
+        self._preloader = QMediaPlayer(self)
+        self._preload_output = QAudioOutput(self)
+        self._preload_output.setMuted(True)
+        self._preloader.setAudioOutput(self._preload_output)
+        self._preload_path = None
 
         # Silence elimination config
         self.skip_silence = True  # Optionally configurable
@@ -177,6 +428,12 @@ class AudioPlayer(QWidget):
         self.playlist_widget.setContextMenuPolicy(Qt.CustomContextMenu)
         self.playlist_widget.customContextMenuRequested.connect(
             self.show_playlist_context_menu)
+        self._playlist_signals = PlaylistLoaderSignals(self)
+        self._playlist_signals.loaded.connect(self.on_playlist_loaded)
+        # One worker, so drops are appended in the order they were made
+        self._playlist_pool = QThreadPool(self)
+        self._playlist_pool.setMaxThreadCount(1)
+        self._playlist_gen = 0
 
         # Drag-and-drop support
         self.setAcceptDrops(True)
@@ -186,6 +443,15 @@ class AudioPlayer(QWidget):
         # Controls/UI
         self.album_art = QLabel(); self.album_art.setFixedSize(256, 256)
         self.album_art.setScaledContents(True)
+        # Loaded and scaled once; reused for every track without artwork
+        default_art = QPixmap("static/images/default_album_art.png")
+        self._default_art = default_art.scaled(
+            self.album_art.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
+        ) if not default_art.isNull() else QPixmap()
+        self._art_key = None
+        self._codec_str = None
+        self._art_signals = ArtLoaderSignals(self)
+        self._art_signals.finished.connect(self.on_album_art_loaded)
         self.title_label = QLabel("-- Title --")
         self.artist_label = QLabel("-- Artist --")
         self.album_label = QLabel("-- Album --")
@@ -200,6 +466,7 @@ class AudioPlayer(QWidget):
         self.slider.sliderMoved.connect(self.on_slider_moved)
         self.slider.sliderReleased.connect(self.on_slider_released)
         self._slider_moving = False
+        self._last_time_key = None
 
         image_path = 'static/images/buttons.jpg'
         tile_width = 1650
@@ -289,22 +556,33 @@ class AudioPlayer(QWidget):
         self.setLayout(main_layout)
 
         # Connections
-        self.player.positionChanged.connect(self.update_slider)
-        self.player.durationChanged.connect(self.update_duration)
-        self.player.mediaStatusChanged.connect(self.media_status_changed)
-        self.player.playbackStateChanged.connect(self.update_play_button)
+        self.connect_player(self.player)
         self.slider.sliderPressed.connect(lambda: self.player.pause())
         self.slider.sliderReleased.connect(lambda: self.player.play())
-        self.player.metaDataChanged.connect(self.update_metadata)
-        self.player.errorOccurred.connect(self.handle_error)
-
-        # For mixing (transition to next track)
-        self.player.positionChanged.connect(self.check_for_mix_transition)
 
         # Init
         self.update_play_button()
         self.show()
 
+    def connect_player(self, player, connect=True):
+        """Wire (or unwire) the UI slots to the signals of player."""
+        pairs = (
+            (player.positionChanged, self.update_slider),
+            (player.positionChanged, self.update_lyrics_display),
+            (player.durationChanged, self.update_duration),
+            (player.mediaStatusChanged, self.media_status_changed),
+            (player.playbackStateChanged, self.update_play_button),
+            (player.metaDataChanged, self.update_metadata),
+            (player.errorOccurred, self.handle_error),
+            # For mixing (transition to next track)
+            (player.positionChanged, self.check_for_mix_transition),
+        )
+        for signal, slot in pairs:
+            if connect:
+                signal.connect(slot)
+            else:
+                signal.disconnect(slot)
+
     # --- Mixing/transition config slots ---
     def set_mix_method(self, method):
         self.mix_method = method
@@ -345,10 +623,17 @@ class AudioPlayer(QWidget):
         if not (0 <= next_idx < len(self.playlist)):
             return
         next_path = self.playlist[next_idx]
-        self.next_player = QMediaPlayer(self)
-        self.next_output = QAudioOutput(self)
-        self.next_player.setAudioOutput(self.next_output)
-        self.next_player.setSource(QUrl.fromLocalFile(next_path))
+        reuse_preloader = next_path == self._preload_path
+        if reuse_preloader:
+            # Fade in the track the preloader has already opened
+            self.next_player, self.next_output = self._preloader, self._preload_output
+            self._preload_path = None
+            self.next_output.setMuted(False)
+        else:
+            self.next_player = QMediaPlayer(self)
+            self.next_output = QAudioOutput(self)
+            self.next_player.setAudioOutput(self.next_output)
+            self.next_player.setSource(QUrl.fromLocalFile(next_path))
         self.next_output.setVolume(0)
         self.next_player.play()
 
@@ -395,23 +680,24 @@ class AudioPlayer(QWidget):
                 self.fade_timer.stop()
                 self.audio_output.setVolume(1.0)
                 self.player.stop()
+                self.connect_player(self.player, connect=False)
+                if reuse_preloader:
+                    # The outgoing player becomes the new preloader
+                    self._preloader, self._preload_output = self.player, self.audio_output
+                    self._preload_output.setMuted(True)
                 # Switch to next player
                 self.player = self.next_player
                 self.audio_output = self.next_output
                 self.current_index = next_idx
+                self._codec_str = None
             #    self.load_track(self.current_index, auto_play=False, skip_mix_check=True)
             #    self.player.play()
                 self.update_play_button()
-                self.player.positionChanged.connect(self.update_slider)
-                self.player.durationChanged.connect(self.update_duration)
-                self.player.mediaStatusChanged.connect(self.media_status_changed)
-                self.player.playbackStateChanged.connect(self.update_play_button)
-                self.player.metaDataChanged.connect(self.update_metadata)
-                self.player.errorOccurred.connect(self.handle_error)
-                self.player.positionChanged.connect(self.check_for_mix_transition)
+                self.connect_player(self.player)
                 self.next_player = None
                 self.next_output = None
                 self._mixing_next = False
+                QTimer.singleShot(2000, self.preload_next)
 
         self.fade_timer.timeout.connect(fade)
         self.fade_timer.start()
@@ -432,18 +718,29 @@ class AudioPlayer(QWidget):
         if 0 <= idx < len(self.playlist):
             path = self.playlist[idx]
             self.current_index = idx
-            self.player.setSource(QUrl.fromLocalFile(path))
+            self._codec_str = None
+            preloaded = (path == self._preload_path
+                         and self._preloader.mediaStatus() == QMediaPlayer.LoadedMedia)
+            if preloaded:
+                self.swap_in_preloader()
+            else:
+                self.player.setSource(QUrl.fromLocalFile(path))
             self.slider.setValue(0)
             self.title_label.setText(os.path.basename(path))
             self.artist_label.setText("-- Artist --")
             self.album_label.setText("-- Album --")
             self.year_label.setText("-- Date --")
             self.codec_label.setText("-- Date --")
+            # mutagen is only consulted on a metadata cache miss
             self.set_album_art(path)
             self.load_lyrics(path)
+            if preloaded:
+                # The preloader already emitted these before it was connected
+                self.update_duration(self.player.duration())
+                self.update_metadata()
             if auto_play:
                 self.player.play()
-            self.lyrics_timer.start()
+            QTimer.singleShot(2000, self.preload_next)
             self.playlist_widget.setCurrentRow(idx)
             # Optionally skip silence at start (very basic, see note below)
             if skip_silence:
@@ -459,10 +756,35 @@ class AudioPlayer(QWidget):
             self.year_label.setText("--")
             self.codec_label.setText("--")
             self.album_art.setPixmap(QPixmap())
+            self._art_key = None
             self.lyrics_display.clear()
-            self.lyrics_timer.stop()
             self.update_play_button()
 
+    def preload_next(self):
+        """Open the track after the current one on the muted preloader."""
+        next_idx = self.current_index + 1
+        if not (0 <= next_idx < len(self.playlist)):
+            return
+        if self.next_player is not None:
+            return  # a fade is using the preloader; it preloads again when done
+        path = self.playlist[next_idx]
+        if path != self._preload_path:
+            self._preload_path = path
+            self._preloader.setSource(QUrl.fromLocalFile(path))
+
+    def swap_in_preloader(self):
+        """Make the preloader the active player and recycle the old one."""
+        old_player, old_output = self.player, self.audio_output
+        old_player.stop()
+        self.connect_player(old_player, connect=False)
+        self.player, self._preloader = self._preloader, old_player
+        self.audio_output, self._preload_output = self._preload_output, old_output
+        self.audio_output.setVolume(old_output.volume())
+        self.audio_output.setMuted(False)
+        self._preload_output.setMuted(True)
+        self._preload_path = None
+        self.connect_player(self.player)
+
     def skip_leading_silence(self):
         """A very basic silence-skip: jump forward if amplitude is zero (needs real audio analysis for best results)."""
         # QMediaPlayer does NOT support sample-level analysis.
@@ -498,25 +820,41 @@ class AudioPlayer(QWidget):
             self.add_files(menu.selectedFiles())
 
     def add_files(self, files):
+        # Playlists are parsed off the UI thread; on_playlist_loaded adds them
+        self._playlist_pool.start(PlaylistLoader(
+            list(files), self.expand_files, self._playlist_gen, self._playlist_signals))
+
+    def expand_files(self, files):
+        """Return files in order, with .m3u/.cue playlists replaced by their tracks."""
+        new_paths = []
         for f in files:
             if os.path.isfile(f):
                 ext = os.path.splitext(f)[1].lower()
-                if ext in ['.m3u', '.m3u8']:
-                    pl = self.load_m3u_playlist(f)
-                    self.playlist += pl
-                    for i in pl:
-                        item = QListWidgetItem(os.path.basename(i))
-                        self.playlist_widget.addItem(item)
-                elif ext == '.cue':
-                    pl = self.load_cue_playlist(f)
-                    self.playlist += pl
-                    for i in pl:
-                        item = QListWidgetItem(os.path.basename(i))
-                        self.playlist_widget.addItem(item)
-                else:
-                    self.playlist.append(f)
-                    item = QListWidgetItem(os.path.basename(f))
-                    self.playlist_widget.addItem(item)
+                try:
+                    if ext in ['.m3u', '.m3u8']:
+                        new_paths += self.load_m3u_playlist(f)
+                    elif ext == '.cue':
+                        new_paths += self.load_cue_playlist(f)
+                    else:
+                        new_paths.append(f)
+                except Exception as e:
+                    print("Playlist loading error:", e)
+        return new_paths
+
+    def on_playlist_loaded(self, generation, new_paths):
+        # Drops made before the last clear_playlist are discarded
+        if generation == self._playlist_gen:
+            self.append_tracks(new_paths)
+
+    def append_tracks(self, new_paths):
+        if new_paths:
+            # One insert and one repaint for the whole batch
+            self.playlist_widget.setUpdatesEnabled(False)
+            self.playlist_widget.blockSignals(True)
+            self.playlist_widget.addItems([os.path.basename(p) for p in new_paths])
+            self.playlist += new_paths
+            self.playlist_widget.blockSignals(False)
+            self.playlist_widget.setUpdatesEnabled(True)
         if self.current_index == -1 and self.playlist:
             self.load_track(0)
 
@@ -576,53 +914,57 @@ class AudioPlayer(QWidget):
                 self.current_index -= 1
 
     def clear_playlist(self):
+        self._playlist_gen += 1
         self.playlist_widget.clear()
         self.playlist.clear()
+        _parse_meta.cache_clear()
+        _album_art.cache_clear()
+        with _art_images_lock:
+            _art_images.clear()
         self.player.stop()
         self.current_index = -1
         self.lyrics_display.clear()
         self.update_play_button()
 
     def set_album_art(self, path):
-        # Use mutagen to extract artwork robustly
-        img_data = None
-        try:
-            audio = File(path)
-            if audio is not None:
-                if hasattr(audio, 'tags'):
-                    tags = audio.tags
-                    # MP3: APIC
-                    if 'APIC:' in tags:
-                        img_data = tags['APIC:'].data
-                    # MP4/M4A: covr
-                    elif hasattr(tags, 'get') and tags.get('covr'):
-                        img_data = tags['covr'][0]
-                    # FLAC: pictures
-                    elif hasattr(audio, 'pictures') and audio.pictures:
-                        img_data = audio.pictures[0].data
-            if img_data:
-                img = QImage.fromData(img_data)
-                pix = QPixmap.fromImage(img)
-                self.album_art.setPixmap(pix.scaled(self.album_art.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
-                return
-        except Exception as e:
-            print("Artwork extraction error:", e)
+        # Decode and scale off the UI thread; on_album_art_loaded applies it
+        size = self.album_art.size()
+        QThreadPool.globalInstance().start(
+            ArtLoader(path, size.width(), size.height(), self._art_signals))
+
+    def on_album_art_loaded(self, path, img):
+        # Ignore results for a track that is no longer current
+        if not (0 <= self.current_index < len(self.playlist)) or self.playlist[self.current_index] != path:
+            return
+        if not img.isNull():
+            # Same cover as the one on screen (e.g. next track of the album)
+            if img.cacheKey() != self._art_key:
+                self._art_key = img.cacheKey()
+                self.album_art.setPixmap(QPixmap.fromImage(img))
+            return
         # Fallback
-        self.album_art.setPixmap(QPixmap("static/images/default_album_art.png") if os.path.exists("static/images/default_album_art.png") else QPixmap())
+        self._art_key = None
+        self.album_art.setPixmap(self._default_art)
 
     def load_lyrics(self, audio_path):
         self.lyrics = SynchronizedLyrics(audio_path)
         self.lyrics_display.set_lyrics(self.lyrics.lines, self.lyrics.is_synchronized())
-        self.update_lyrics_display()
-
-    def update_lyrics_display(self):
-        if self.lyrics and self.lyrics.lines:
-            idx = self.lyrics.get_current_line(
-                self.player.position()) if self.lyrics.is_synchronized() else -1
-            self.lyrics_display.highlight_line(idx)
+        if self.lyrics.lines:
+            self.update_lyrics_display()
         else:
             self.lyrics_display.setText("No lyrics found.")
 
+    def update_lyrics_display(self, position=None):
+        # Driven by positionChanged; most calls end at the index compare
+        if not (self.lyrics and self.lyrics_display.is_synchronized):
+            return
+        if position is None:
+            position = self.player.position()
+        idx = self.lyrics.get_current_line(position)
+        if idx == self.lyrics_display.current_line_idx:
+            return
+        self.lyrics_display.highlight_line(idx)
+
 
     def prev_track(self):
         if self.current_index > 0:
@@ -648,10 +990,12 @@ class AudioPlayer(QWidget):
     def update_slider(self, position):
         duration = self.player.duration()
         if duration > 0:
-            value = int((position / duration) * 100)
-            self.slider.blockSignals(True)
-            self.slider.setValue(value)
-            self.slider.blockSignals(False)
+            value = position * 100 // duration
+            # Most ticks land on the same percent; skip the redundant repaint
+            if value != self.slider.value():
+                self.slider.blockSignals(True)
+                self.slider.setValue(value)
+                self.slider.blockSignals(False)
         self.update_time_label(position, duration)
 
     def on_slider_moved(self, value):
@@ -677,11 +1021,16 @@ class AudioPlayer(QWidget):
             self.player.setPosition(new_position)
 
     def update_time_label(self, position, duration):
+        ms = max(0, duration - position) if self.show_remaining else position
+        # positionChanged fires several times per second; redraw once per second
+        key = (self.show_remaining, ms // 1000)
+        if key == self._last_time_key:
+            return
+        self._last_time_key = key
         if self.show_remaining:
-            remaining = max(0, duration - position)
-            self.time_label.setText("-" + self.format_time(remaining))
+            self.time_label.setText("-" + self.format_time(ms))
         else:
-            self.time_label.setText(self.format_time(position))
+            self.time_label.setText(self.format_time(ms))
 
     def toggle_time_display(self):
         self.show_remaining = not self.show_remaining
@@ -719,6 +1068,8 @@ class AudioPlayer(QWidget):
     def format_time(ms):
         s = ms // 1000
         m, s = divmod(s, 60)
+        if m < 100:
+            return _TWO_DIGITS[m] + ":" + _TWO_DIGITS[s]
         return f"{m:02}:{s:02}"
 
     def extract_year(self, meta):
@@ -729,28 +1080,47 @@ class AudioPlayer(QWidget):
             if isinstance(date_val, QDate):
                 return str(date_val.year())
             if isinstance(date_val, str):
-                match = re.search(r'\b(\d{4})\b', date_val)
+                match = _YEAR_RE.search(date_val)
                 if match:
                     return match.group(1)
             date_str = str(date_val)
-            match = re.search(r'\b(\d{4})\b', date_str)
+            match = _YEAR_RE.search(date_str)
             if match:
                 return match.group(1)
         # If FLAC, try mutagen
         audio_path = self.playlist[self.current_index]
         if audio_path.lower().endswith(".flac"):
+            year = _meta_cache.get(audio_path, "year")
+            if year is not None:
+                return year
+            year = "--"
             try:
-                audio = FLAC(audio_path)
+                audio = _load_meta(audio_path)
                 for tag in ("date", "year", "year_released"):
                     if tag in audio:
-                        return audio[tag][0][:4]
+                        year = audio[tag][0][:4]
+                        break
             except Exception:
                 pass
+            _meta_cache.put(audio_path, "year", year)
+            return year
         return "--"
 
     def extract_audio_info(self):
-        audio = File(self.playlist[self.current_index])
-        if not audio:
+        # metaDataChanged fires several times per track; format once
+        if self._codec_str is None:
+            path = self.playlist[self.current_index]
+            info = _meta_cache.get(path, "codec")
+            if info is None:
+                info = self._format_audio_info(path)
+                if info is not None:
+                    _meta_cache.put(path, "codec", info)
+            self._codec_str = info or ""
+        return self._codec_str or "--"
+
+    def _format_audio_info(self, path):
+        audio = _load_meta(path)
+        if audio is None:
             print("Unsupported or corrupted file.")
             return
 
@@ -762,10 +1132,14 @@ class AudioPlayer(QWidget):
         sample_rate = getattr(audio.info, 'sample_rate', None)
         bits = getattr(audio.info, 'bits_per_sample', None)
         bitrate = getattr(audio.info, 'bitrate', None)
+        # Any of these may be missing (or zero) depending on the container
+        khz = f"{sample_rate / 1000:g}kHz" if sample_rate else ""
+        kbps = f"{round(bitrate / 1000)}kbps" if bitrate else ""
         if codec == 'audio/mp3':
-            return codec + ' ' + str(sample_rate/1000) + 'kHz ' + str(round(bitrate/1000)) + 'kbps'
+            return f"{codec} {khz} {kbps}"
         else:
-            return codec + ' ' + str(sample_rate/1000) + 'kHz/' + str(round(bits)) + 'bits  ' + str(round(bitrate/1000)) + 'kbps'
+            bits_str = f"/{round(bits)}bits" if bits else ""
+            return f"{codec} {khz}{bits_str}  {kbps}"
 
 
 if __name__ == "__main__":
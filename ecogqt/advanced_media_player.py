@@ -1,9 +1,10 @@
 import sys
 import os
+from pathlib import Path
 from PySide6.QtCore import Qt, QUrl, Slot, QTimer, QSize
 from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QSlider, QFileDialog, QTextEdit
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QSlider, QFileDialog, QScrollArea
 )
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput, QMediaMetaData
 
@@ -30,6 +31,11 @@ class AdvancedAudioPlayer(QWidget):
         self.album_art = QLabel()
         self.album_art.setFixedSize(128, 128)
         self.album_art.setScaledContents(True)
+        # Loaded and scaled once; reused for every track without artwork
+        default_art = QPixmap("default_album_art.png")
+        self._default_art = default_art.scaled(
+            self.album_art.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
+        ) if not default_art.isNull() else QPixmap()
         info_layout.addWidget(self.album_art)
 
         meta_layout = QVBoxLayout()
@@ -65,11 +71,17 @@ class AdvancedAudioPlayer(QWidget):
         controls_layout.addWidget(self.next_button)
         main_layout.addLayout(controls_layout)
 
-        # Lyrics display
-        self.lyrics_display = QTextEdit()
-        self.lyrics_display.setReadOnly(True)
-        self.lyrics_display.setFixedHeight(100)
-        main_layout.addWidget(self.lyrics_display)
+        # Lyrics display (plain text only, so a label is enough)
+        self.lyrics_display = QLabel()
+        self.lyrics_display.setWordWrap(True)
+        self.lyrics_display.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.lyrics_display.setTextFormat(Qt.PlainText)
+        self.lyrics_display.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        lyrics_scroll = QScrollArea()
+        lyrics_scroll.setWidgetResizable(True)
+        lyrics_scroll.setWidget(self.lyrics_display)
+        lyrics_scroll.setFixedHeight(100)
+        main_layout.addWidget(lyrics_scroll)
 
         # Signals
         self.prev_button.clicked.connect(self.prev_track)
@@ -120,7 +132,7 @@ class AdvancedAudioPlayer(QWidget):
             pix = QPixmap.fromImage(img)
             self.album_art.setPixmap(pix.scaled(self.album_art.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
         else:
-            self.album_art.setPixmap(QPixmap("default_album_art.png") if os.path.exists("default_album_art.png") else QPixmap())
+            self.album_art.setPixmap(self._default_art)
 
     def prev_track(self):
         if self.current_index > 0:
@@ -147,10 +159,12 @@ class AdvancedAudioPlayer(QWidget):
     def update_slider(self, position):
         duration = self.player.duration()
         if duration > 0:
-            value = int((position / duration) * 100)
-            self.slider.blockSignals(True)
-            self.slider.setValue(value)
-            self.slider.blockSignals(False)
+            value = position * 100 // duration
+            # Most ticks land on the same percent; skip the redundant repaint
+            if value != self.slider.value():
+                self.slider.blockSignals(True)
+                self.slider.setValue(value)
+                self.slider.blockSignals(False)
         self.update_time_label(position, duration)
 
     def update_duration(self, duration):
@@ -187,10 +201,9 @@ class AdvancedAudioPlayer(QWidget):
     def load_lyrics(self, audio_path):
         # Try to load .lrc with same basename
         lrc_path = os.path.splitext(audio_path)[0] + ".lrc"
-        if os.path.exists(lrc_path):
-            with open(lrc_path, "r", encoding="utf-8") as f:
-                self.lyrics[audio_path] = f.read()
-        else:
+        try:
+            self.lyrics[audio_path] = Path(lrc_path).read_text(encoding="utf-8")
+        except OSError:
             self.lyrics[audio_path] = "No lyrics found for this track."
 
     @staticmethod
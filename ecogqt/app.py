@@ -2,17 +2,27 @@
 import os
 import sys
 import json
+import hashlib
 import math
+import re
+import shutil
+import subprocess
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from dataclasses import dataclass, asdict
-from pydub import AudioSegment, silence
+import numpy as np
+from pydub import AudioSegment
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Qt, QUrl, QTimer, Property
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QFileDialog, QListWidget, QListWidgetItem, QVBoxLayout,
+    QApplication, QMainWindow, QWidget, QFileDialog, QListWidget, QListWidgetItem, QListView, QVBoxLayout,
     QHBoxLayout, QLabel, QPushButton, QLineEdit, QComboBox, QSplitter, QSlider, QMessageBox, QStyle
 )
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
+from shiboken6 import VoidPtr
 
 
 try:
@@ -20,13 +30,38 @@ try:
 except Exception:
     MutagenFile = None
 
+try:
+    import orjson
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    loads = orjson.loads
+except Exception:
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+    loads = json.loads
+
 APP_DIR = Path.home() / ".ecog_qt_player"
-APP_DIR.mkdir(exist_ok=True)
 PLAYLISTS_FILE = APP_DIR / "playlists.json"
 SETTINGS_FILE = APP_DIR / "settings.json"
+LIBRARY_DB = APP_DIR / "library.db"
 
 AUDIO_EXTS = {".mp3",".flac",".m4a",".aac",".ogg",".wav",".wma",".opus"}
 
+FFMPEG = shutil.which("ffmpeg")
+# Larger files are not analysed for silences (full decode is too costly)
+# unless the "silence_large_files" setting is on
+SILENCE_MAX_BYTES = 200_000_000
+# silencedetect logs a silence_start line and later its silence_end line
+SILENCE_RE = re.compile(r"silence_start: (-?[\d.]+).*?silence_end: ([\d.]+)", re.S)
+
+_ICONS = {}
+
+def standard_icon(pixmap: QStyle.StandardPixmap) -> QtGui.QIcon:
+    """Application style icon, created once per process."""
+    if pixmap not in _ICONS:
+        _ICONS[pixmap] = QApplication.style().standardIcon(pixmap)
+    return _ICONS[pixmap]
+
 def human_time(seconds:int)->str:
     seconds = max(0, int(seconds))
     return f"{seconds//60}:{seconds%60:02d}"
@@ -41,6 +76,37 @@ class Track:
     cover_path: str = ""
     silences: list = None  # [(start_ms, end_ms), ...]
 
+def iter_audio_files(root):
+    """Yield os.DirEntry for every audio file below root, recursively."""
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    with it:
+        for e in it:
+            try:
+                if e.is_dir(follow_symlinks=False):
+                    yield from iter_audio_files(e.path)
+                    continue
+            except OSError:
+                continue
+            if os.path.splitext(e.name)[1].lower() in AUDIO_EXTS:
+                yield e
+
+def track_to_json(t: Track) -> dict:
+    d = asdict(t)
+    # Stored flat as [s0, e0, s1, e1, ...]
+    if t.silences:
+        d["silences"] = [int(x) for pair in t.silences for x in pair]
+    return d
+
+def track_from_json(d: dict) -> Track:
+    s = d.get("silences")
+    # Playlists saved before the flat layout hold [[s0, e0], ...]
+    if s and not isinstance(s[0], list):
+        d = {**d, "silences": [s[i:i+2] for i in range(0, len(s), 2)]}
+    return Track(**d)
+
 def read_metadata(p: Path) -> Track:
     t = Track(path=str(p), title=p.stem)
     if MutagenFile is None:
@@ -66,19 +132,159 @@ def read_metadata(p: Path) -> Track:
     return t
 
 
-def analyze_silences(path, threshold_db=-46, min_silence_ms=500):
-    """Use pydub to detect silence in audio file, return [(start,end),...] in ms."""
+def analyze_silences(path, threshold_db=-46, min_silence_ms=500, seek_step=None):
+    """Detect silence in audio file, return [(start,end),...] in ms.
+
+    Uses FFmpeg's silencedetect filter when ffmpeg is on PATH, pydub otherwise.
+    seek_step (ms) only applies to the pydub path; by default windows are
+    tested every tenth of min_silence_ms.
+    """
+    if FFMPEG:
+        return _ffmpeg_silences(path, threshold_db, min_silence_ms)
+    if seek_step is None:
+        seek_step = max(1, min_silence_ms // 10)
     try:
         audio = AudioSegment.from_file(path)
-        silences = silence.detect_silence(
+        silences = detect_silence(
             audio,
             min_silence_len=min_silence_ms,
-            silence_thresh=threshold_db
+            silence_thresh=threshold_db,
+            seek_step=seek_step
         )
         return silences
     except Exception:
         return []
 
+def detect_silence(audio, min_silence_len=1000, silence_thresh=-16, seek_step=1):
+    """NumPy version of pydub.silence.detect_silence, same arguments and result.
+
+    Signal energy is summed per millisecond once; every window's RMS then
+    comes from a cumulative sum instead of re-reading overlapping slices.
+    """
+    sr, channels = audio.frame_rate, audio.channels
+    samples = np.asarray(audio.get_array_of_samples())
+    seg_len = len(audio)
+    if seg_len < min_silence_len:
+        return []
+    # Sample offset of each millisecond boundary, as pydub slices by ms
+    bounds = np.arange(seg_len + 1, dtype=np.int64) * sr // 1000 * channels
+    if samples.size < bounds[-1]:
+        # len(audio) rounds up; pydub pads the short last slice with silence
+        samples = np.pad(samples, (0, int(bounds[-1]) - samples.size))
+    energy = np.empty(seg_len)
+    for a in range(0, seg_len, 10_000):  # bounded float64 temporaries
+        b = min(a + 10_000, seg_len)
+        chunk = samples[bounds[a]:bounds[b]].astype(np.float64)
+        energy[a:b] = np.add.reduceat(chunk * chunk, bounds[a:b] - bounds[a])
+    cs = np.concatenate(([0.0], np.cumsum(energy)))
+
+    # Like pydub, the last possible window is always tested
+    last_slice_start = seg_len - min_silence_len
+    starts = np.arange(0, last_slice_start + 1, seek_step)
+    if last_slice_start % seek_step:
+        starts = np.append(starts, last_slice_start)
+    ends = starts + min_silence_len
+    mean_square = (cs[ends] - cs[starts]) / (bounds[ends] - bounds[starts])
+    # audioop.rms truncates to an integer before pydub compares it
+    thresh = 10 ** (silence_thresh / 20.0) * audio.max_possible_amplitude
+    silent = starts[mean_square < (math.floor(thresh) + 1) ** 2]
+    if not silent.size:
+        return []
+    # Windows merge unless they are neither consecutive nor overlapping
+    d = np.diff(silent)
+    gaps = np.flatnonzero((d != seek_step) & (d > min_silence_len))
+    run_starts = silent[np.concatenate(([0], gaps + 1))]
+    run_ends = silent[np.concatenate((gaps, [silent.size - 1]))] + min_silence_len
+    return [[int(s), int(e)] for s, e in zip(run_starts, run_ends)]
+
+def _ffmpeg_silences(path, threshold_db, min_silence_ms):
+    cmd = [
+        FFMPEG, "-nostats", "-hide_banner", "-i", str(path), "-vn",
+        "-af", f"silencedetect=noise={threshold_db}dB:d={min_silence_ms/1000}",
+        "-c:a", "pcm_s16le", "-f", "null", "-",
+    ]
+    try:
+        # A windowed (pyinstaller -w) build would flash a console per track
+        flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+        proc = subprocess.run(cmd, capture_output=True, text=True, errors="replace",
+                              creationflags=flags)
+    except OSError:
+        return []
+    return [
+        (max(0, int(float(start) * 1000)), int(float(end) * 1000))
+        for start, end in SILENCE_RE.findall(proc.stderr)
+    ]
+
+def open_library_db(path: Path = LIBRARY_DB) -> sqlite3.Connection:
+    """Open the scan cache; rows are valid while path, mtime and size match.
+
+    silences is NULL until the track is first played, and only applies to the
+    silence_db/silence_ms it was computed with. quickhash (see quick_hash)
+    lets a moved file keep its silences.
+    """
+    db = sqlite3.connect(str(path))
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS tracks ("
+        "path TEXT PRIMARY KEY, mtime REAL, size INTEGER, "
+        "silence_db INTEGER, silence_ms INTEGER, "
+        "title TEXT, artist TEXT, album TEXT, duration REAL, cover_path TEXT, silences TEXT, "
+        "quickhash TEXT)"
+    )
+    # Databases written before quickhash existed
+    if "quickhash" not in {row[1] for row in db.execute("PRAGMA table_info(tracks)")}:
+        db.execute("ALTER TABLE tracks ADD COLUMN quickhash TEXT")
+    db.execute("CREATE INDEX IF NOT EXISTS tracks_quickhash ON tracks (quickhash)")
+    return db
+
+def quick_hash(p: Path, st: os.stat_result) -> str:
+    """Cheap content key: hash of the first 4 KiB plus the file size."""
+    with open(p, "rb") as f:
+        head = f.read(4096)
+    return f"{hashlib.blake2b(head, digest_size=8).hexdigest()}-{st.st_size}"
+
+# Per-thread read connection for scan workers (sqlite connections are thread-bound)
+_scan_local = threading.local()
+
+def _open_scan_reader(path: Path):
+    _scan_local.db = sqlite3.connect(str(path))
+
+def read_new_file(p: Path, st: os.stat_result, silence_db, silence_ms):
+    """Scan worker job for a cache miss: (track, quickhash, silences JSON or None).
+
+    Silences come from a row with the same quickhash, i.e. a moved copy of
+    the file, when they were computed with the same settings.
+    """
+    track = read_metadata(p)
+    try:
+        qh = quick_hash(p, st)
+    except OSError:
+        return track, None, None
+    moved = _scan_local.db.execute(
+        "SELECT silences FROM tracks WHERE quickhash=? AND silences IS NOT NULL "
+        "AND silence_db=? AND silence_ms=? LIMIT 1",
+        (qh, silence_db, silence_ms)
+    ).fetchone()
+    return track, qh, moved[0] if moved else None
+
+
+class SilenceSignals(QtCore.QObject):
+    finished = QtCore.Signal(str, list)
+
+class SilenceRunnable(QtCore.QRunnable):
+    """Run analyze_silences for one file on a QThreadPool worker."""
+    def __init__(self, path, threshold_db, min_silence_ms, seek_step, signals):
+        super().__init__()
+        self.path = path
+        self.threshold_db = threshold_db
+        self.min_silence_ms = min_silence_ms
+        self.seek_step = seek_step
+        self.signals = signals
+
+    def run(self):
+        silences = analyze_silences(
+            self.path, threshold_db=self.threshold_db, min_silence_ms=self.min_silence_ms,
+            seek_step=self.seek_step)
+        self.signals.finished.emit(self.path, silences)
 
 class VolumeAnim(QtCore.QObject):
     """Animate QAudioOutput volume 0..1 with QPropertyAnimation."""
@@ -92,10 +298,17 @@ class VolumeAnim(QtCore.QObject):
     volume = Property(float, getVolume, setVolume)
 
 class PlayerWidget(QWidget):
+    """Dual-player queue widget.
+
+    mode="full" shows the crossfade and Gap Killer controls; mode="simple" is
+    a plain transport with neither.
+    """
     request_reveal = QtCore.Signal(str)
+    silences_ready = QtCore.Signal(str, list)
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, mode="full"):
         super().__init__(parent)
+        self.mode = mode
         self.player1 = QMediaPlayer(self)
         self.player2 = QMediaPlayer(self)
         self.audio1 = QAudioOutput(self)
@@ -104,6 +317,13 @@ class PlayerWidget(QWidget):
         self.player2.setAudioOutput(self.audio2)
         self.audio1.setVolume(1.0)
         self.audio2.setVolume(0.0)
+        # One volume animation per output, reconfigured for every crossfade
+        self.fade1 = QtCore.QPropertyAnimation(VolumeAnim(self.audio1, self), b"volume", self)
+        self.fade2 = QtCore.QPropertyAnimation(VolumeAnim(self.audio2, self), b"volume", self)
+        self.fade_group = QtCore.QParallelAnimationGroup(self)
+        self.fade_group.addAnimation(self.fade1)
+        self.fade_group.addAnimation(self.fade2)
+        self.fade_group.finished.connect(self.finish_and_advance)
 
         self.current_index = 0
         self.playlist: list[Track] = []
@@ -113,22 +333,46 @@ class PlayerWidget(QWidget):
         self.silence_threshold_db = -46
         self.silence_min_duration = 0.5
         self._silence_ms = 0
+        # Silence analysis settings for tracks still lacking silences
+        self.silence_scan_db = -46
+        self.silence_scan_ms = 100
+        self.silence_scan_step = None  # pydub fallback resolution, None = automatic
+        self.silence_large_files = False  # also analyse files over SILENCE_MAX_BYTES
+        self._silence_pending = set()
+        self._silence_edges = (None, None, None)  # (silences, starts, ends)
+        self._silence_signals = SilenceSignals(self)
+        self._silence_signals.finished.connect(self.on_silences_ready)
+        # Background analysis should never compete with playback or the UI
+        self.silence_pool = QtCore.QThreadPool(self)
+        self.silence_pool.setMaxThreadCount(2)
+        self.silence_pool.setThreadPriority(QtCore.QThread.LowPriority)
 
         # UI
         top = QHBoxLayout()
-        self.btn_prev = QPushButton(self.style().standardIcon(QStyle.SP_MediaSkipBackward), "")
-        self.btn_play = QPushButton(self.style().standardIcon(QStyle.SP_MediaPlay), "")
-        self.btn_next = QPushButton(self.style().standardIcon(QStyle.SP_MediaSkipForward), "")
+        self.btn_prev = QPushButton(standard_icon(QStyle.SP_MediaSkipBackward), "")
+        self.btn_play = QPushButton(standard_icon(QStyle.SP_MediaPlay), "")
+        self.btn_next = QPushButton(standard_icon(QStyle.SP_MediaSkipForward), "")
         self.time_label = QLabel("0:00 / 0:00")
+        # Duration text is formatted once per track; the label only changes each second
+        self._dur = None
+        self._dur_str = "0:00"
+        self._last_pos_str = None
         top.addWidget(self.btn_prev); top.addWidget(self.btn_play); top.addWidget(self.btn_next)
         top.addWidget(self.time_label, 1)
+        # Seek bar in whole seconds, shown in both modes
+        self.seek_slider = QSlider(Qt.Horizontal)
+        self.seek_slider.setRange(0, 0)
 
-        settings = QHBoxLayout()
+        self.fade_box = QWidget()
+        settings = QHBoxLayout(self.fade_box)
+        settings.setContentsMargins(0, 0, 0, 0)
         self.fade_label = QLabel("Crossfade: 4s")
         self.fade_slider = QSlider(Qt.Horizontal); self.fade_slider.setRange(0, 12); self.fade_slider.setValue(6)
         settings.addWidget(self.fade_label); settings.addWidget(self.fade_slider,1)
 
-        gapbox = QHBoxLayout()
+        self.gap_box = QWidget()
+        gapbox = QHBoxLayout(self.gap_box)
+        gapbox.setContentsMargins(0, 0, 0, 0)
         self.chk_gap = QtWidgets.QCheckBox("Gap Killer")
         self.chk_gap.setChecked(True)
         self.silence_db = QSlider(Qt.Horizontal); self.silence_db.setRange(-60, -20); self.silence_db.setValue(-46)
@@ -144,26 +388,34 @@ class PlayerWidget(QWidget):
 
         lay = QVBoxLayout(self)
         lay.addLayout(top)
-        lay.addLayout(settings)
-        lay.addLayout(gapbox)
+        lay.addWidget(self.seek_slider)
+        lay.addWidget(self.fade_box)
+        lay.addWidget(self.gap_box)
         lay.addLayout(meta)
+        if mode == "simple":
+            self.fade_box.hide(); self.gap_box.hide()
+            self.crossfade_seconds = 0
+            self.gap_enabled = False
 
         # Connections
         self.btn_play.clicked.connect(self.toggle_play)
         self.btn_prev.clicked.connect(self.prev_track)
         self.btn_next.clicked.connect(self.next_track)
+        self.seek_slider.sliderMoved.connect(lambda v: self.current_player().setPosition(v * 1000))
         self.fade_slider.valueChanged.connect(self.on_fade_changed)
         self.chk_gap.toggled.connect(lambda v: setattr(self, "gap_enabled", v))
         self.silence_db.valueChanged.connect(lambda v: setattr(self, "silence_threshold_db", v))
         self.silence_dur.valueChanged.connect(lambda v: setattr(self, "silence_min_duration", v/10.0))
         self.reveal_btn.clicked.connect(self.reveal_current)
 
-        self.timer = QTimer(self); self.timer.timeout.connect(self.update_time); self.timer.start(250)
+        # Polled at 4 Hz instead of following every positionChanged emission
+        self.timer = QTimer(self); self.timer.timeout.connect(self.on_time_change); self.timer.start(250)
+        # Lands exactly on a silence that starts between two polls
+        self.silence_timer = QTimer(self); self.silence_timer.setSingleShot(True)
+        self.silence_timer.timeout.connect(self.on_time_change)
 
         self.player1.mediaStatusChanged.connect(self.on_status1)
         self.player2.mediaStatusChanged.connect(self.on_status2)
-        self.player1.positionChanged.connect(self.on_time_change)
-        self.player2.positionChanged.connect(self.on_time_change)
 
     def reveal_current(self):
         if 0 <= self.current_index < len(self.playlist):
@@ -173,6 +425,7 @@ class PlayerWidget(QWidget):
     def set_playlist(self, tracks: list[Track], start_index=0):
         self.playlist = tracks
         self.current_index = max(0, min(start_index, len(tracks)-1))
+        self.fade_group.stop()
         self.active = 1
         self.audio1.setVolume(1.0); self.audio2.setVolume(0.0)
         self.load_current()
@@ -196,14 +449,45 @@ class PlayerWidget(QWidget):
             self.play()
 
     def next_track(self):
-        if self.current_index + 1 < len(self.playlist):
+        if self.fade_group.state() == QtCore.QAbstractAnimation.Running:
+            # Mid-fade, Next just completes the transition to the incoming track
+            self.finish_and_advance()
+        elif self.current_index + 1 < len(self.playlist):
             self.start_crossfade_or_next(force_next=True)
 
     def load_current(self):
         if not self.playlist:
             return
         url = QUrl.fromLocalFile(self.playlist[self.current_index].path)
-        self.current_player().setSource(url)
+        p = self.current_player()
+        # After a crossfade the incoming player is already playing this track
+        if p.source() != url or p.playbackState() != QMediaPlayer.PlayingState:
+            p.setSource(url)
+        self._dur = self._last_pos_str = None
+        self.prefetch_silences()
+
+    def prefetch_silences(self):
+        """Analyse silences in the background for the current and next two tracks."""
+        if self.mode != "full":
+            return
+        for t in self.playlist[self.current_index:self.current_index + 3]:
+            if t.silences is None and t.path not in self._silence_pending:
+                try:
+                    if not self.silence_large_files and os.path.getsize(t.path) > SILENCE_MAX_BYTES:
+                        continue
+                except OSError:
+                    continue
+                self._silence_pending.add(t.path)
+                self.silence_pool.start(SilenceRunnable(
+                    t.path, self.silence_scan_db, self.silence_scan_ms, self.silence_scan_step,
+                    self._silence_signals))
+
+    def on_silences_ready(self, path: str, silences: list):
+        self._silence_pending.discard(path)
+        for t in self.playlist:
+            if t.path == path:
+                t.silences = silences
+        self.silences_ready.emit(path, silences)
 
     def play(self):
         self.current_player().play()
@@ -224,31 +508,49 @@ class PlayerWidget(QWidget):
     def on_status2(self, st): self.on_status_generic(self.player2)
     def on_status_generic(self, p: QMediaPlayer):
         if p.mediaStatus() == QMediaPlayer.EndOfMedia:
+            # The fading-out track ends on its own; fade_group.finished advances
+            if p is self.current_player() and self.fade_group.state() == QtCore.QAbstractAnimation.Running:
+                return
             self.finish_and_advance()
 
-    def on_time_change(self, pos:int):
+    def on_time_change(self):
         self.update_time()
+        if self.current_player().playbackState() != QMediaPlayer.PlayingState:
+            return
+        pos = self.current_player().position()
         dur = self.current_player().duration()
         # Silence skip
         if 0 <= self.current_index < len(self.playlist):
             track = self.playlist[self.current_index]
             if track.silences:
-                for start, end in track.silences:
-                    if start <= pos <= end:
-                        self.current_player().setPosition(end + 50)
-                        break
+                starts, ends = self.silence_edges(track)
+                i = np.searchsorted(ends, pos)
+                if i < len(starts):
+                    if starts[i] <= pos:
+                        self.current_player().setPosition(int(ends[i]) + 50)
+                    elif starts[i] - pos < self.timer.interval():
+                        self.silence_timer.start(int(starts[i] - pos))
         # Crossfade
         if dur > 0 and self.crossfade_seconds > 0:
             ms_left = dur - self.current_player().position()
             if 0 < ms_left <= self.crossfade_seconds * 1000 and self.current_index + 1 < len(self.playlist):
                 self.start_crossfade_or_next()
 
+    def silence_edges(self, track: Track):
+        """Sorted start/end arrays of track.silences, rebuilt only when they change."""
+        if self._silence_edges[0] is not track.silences:
+            edges = np.asarray(track.silences, dtype=np.int32).reshape(-1, 2)
+            self._silence_edges = (track.silences, edges[:, 0].copy(), edges[:, 1].copy())
+        return self._silence_edges[1:]
+
     def start_crossfade_or_next(self, force_next=False):
         if self.other_player().source().isEmpty() or force_next:
             next_idx = self.current_index + 1
             if next_idx >= len(self.playlist): return
             next_url = QUrl.fromLocalFile(self.playlist[next_idx].path)
-            self.other_player().setSource(next_url)
+            if (self.other_player().source() != next_url
+                    or self.other_player().playbackState() != QMediaPlayer.PlayingState):
+                self.other_player().setSource(next_url)
         self.other_player().play()
         self.crossfade(self.crossfade_seconds)
 
@@ -257,18 +559,21 @@ class PlayerWidget(QWidget):
         if seconds == 0:
             self.finish_and_advance()
             return
-        self.fade_out = QtCore.QPropertyAnimation(VolumeAnim(self.current_audio()), b"volume")
-        self.fade_in  = QtCore.QPropertyAnimation(VolumeAnim(self.other_audio()), b"volume")
-        for anim in (self.fade_out, self.fade_in):
+        if self.fade_group.state() == QtCore.QAbstractAnimation.Running:
+            return
+        fade_out, fade_in = (self.fade1, self.fade2) if self.active == 1 else (self.fade2, self.fade1)
+        for anim in (fade_out, fade_in):
             anim.setDuration(seconds*1000)
-            anim.setStartValue(1.0 if anim is self.fade_out else 0.0)
-            anim.setEndValue(0.0 if anim is self.fade_out else 1.0)
-        self.fade_in.finished.connect(self.finish_and_advance)
-        self.fade_out.start(); self.fade_in.start()
+            anim.setStartValue(1.0 if anim is fade_out else 0.0)
+            anim.setEndValue(0.0 if anim is fade_out else 1.0)
+        self.fade_group.start()
 
     def finish_and_advance(self):
+        # Runs once per transition, whichever of EndOfMedia or the fade comes first
+        self.fade_group.stop()
         self.current_player().stop()
         self.active = 2 if self.active == 1 else 1
+        self.current_audio().setVolume(1.0); self.other_audio().setVolume(0.0)
         self.current_index += 1
         if self.current_index >= len(self.playlist):
             self.current_index = len(self.playlist)-1
@@ -279,9 +584,11 @@ class PlayerWidget(QWidget):
         self.update_meta()
 
     def swap_and_play(self, load_only=False):
+        self.fade_group.stop()
         self.current_player().stop()
         self.other_player().stop()
         self.active = 2 if self.active == 1 else 1
+        self.current_audio().setVolume(1.0); self.other_audio().setVolume(0.0)
         self.load_current()
         if not load_only:
             self.current_player().play()
@@ -289,9 +596,20 @@ class PlayerWidget(QWidget):
 
     def update_time(self):
         p = self.current_player()
-        pos = p.position()//1000
         dur = max(0, p.duration()//1000)
-        self.time_label.setText(f"{human_time(pos)} / {human_time(dur)}")
+        if dur != self._dur:
+            # Duration arrives asynchronously after setSource
+            self._dur, self._dur_str = dur, human_time(dur)
+            self._last_pos_str = None
+            self.seek_slider.setRange(0, dur)
+        pos = p.position()//1000
+        pos_str = human_time(pos)
+        if pos_str == self._last_pos_str:
+            return
+        self._last_pos_str = pos_str
+        self.time_label.setText(f"{pos_str} / {self._dur_str}")
+        if not self.seek_slider.isSliderDown():
+            self.seek_slider.setValue(pos)
 
     def update_meta(self):
         if 0 <= self.current_index < len(self.playlist):
@@ -299,6 +617,8 @@ class PlayerWidget(QWidget):
             self.meta_label.setText(f"<b>{t.artist or 'Unknown Artist'}</b> — {t.title}<br/><span style='color:#666'>{t.album}</span><br/>{t.path}")
 
     # --- Gap Killer (experimental)
+    # Not connected: Qt 6 has no QAudioProbe, so the live Gap Killer probe
+    # (and _kernels.rms_db) only runs once a buffer source is wired up
     def on_buffer1(self, buf): self._probe_buffer(buf, which=1)
     def on_buffer2(self, buf): self._probe_buffer(buf, which=2)
 
@@ -313,32 +633,22 @@ class PlayerWidget(QWidget):
             frames = buffer.frameCount()
             if frames <= 0:
                 return
-            data = buffer.data()
-            import array, struct
+            # Sized view of the backend's memory, read in place without a copy
+            data = VoidPtr(buffer.constData(), buffer.byteCount(), False)
             if fmt.sampleFormat() == fmt.Float:
-                floats = [abs(struct.unpack_from('f', data, i)[0]) for i in range(0, len(data), 4)]
-                if not floats: return
-                rms = math.sqrt(sum(x*x for x in floats)/len(floats))
+                dtype, scale = np.float32, 1.0
             elif fmt.sampleFormat() == fmt.Int16:
-                arr = array.array('h')
-                arr.frombytes(data[:len(data)//2*2])
-                if not arr: return
-                norm = [abs(x)/32768.0 for x in arr]
-                rms = math.sqrt(sum(x*x for x in norm)/len(norm))
+                dtype, scale = np.int16, 32768.0
             elif fmt.sampleFormat() == fmt.Int8:
-                arr = array.array('b')
-                arr.frombytes(data)
-                if not arr: return
-                norm = [abs(x)/128.0 for x in arr]
-                rms = math.sqrt(sum(x*x for x in norm)/len(norm))
+                dtype, scale = np.int8, 128.0
             else:
-                arr = array.array('i')
-                arr.frombytes(data[:len(data)//4*4])
-                if not arr: return
-                norm = [abs(x)/2147483648.0 for x in arr]
-                rms = math.sqrt(sum(x*x for x in norm)/len(norm))
-
-            db = 20*math.log10(rms) if rms>0 else -120
+                dtype, scale = np.int32, 2147483648.0
+            # Ignore a trailing partial sample, as the array-based version did
+            a = np.frombuffer(data, dtype=dtype, count=buffer.byteCount() // np.dtype(dtype).itemsize)
+            if not a.size: return
+            # Imported here: numba is slow to load and this path rarely runs
+            from ._kernels import rms_db
+            db = rms_db(a, scale)
             if db < self.silence_threshold_db:
                 self._silence_ms += buffer.duration()/1000.0
                 self.gap_status.setText(f"Silent {self._silence_ms:.1f}ms @ {db:.1f}dB")
@@ -404,16 +714,44 @@ class LibraryPanel(QWidget):
         pid = item.data(Qt.UserRole)
         self.request_load_playlist.emit(pid)
 
+class TrackListModel(QtCore.QAbstractListModel):
+    """Read-only list of Track; row labels are built only when Qt asks for them."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tracks: list[Track] = []
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.tracks)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        t = self.tracks[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{t.artist or 'Unknown Artist'} — {t.title} ({t.album})"
+        if role == Qt.UserRole:
+            return t
+        return None
+
+    def set_tracks(self, tracks: list[Track]):
+        self.beginResetModel()
+        self.tracks = tracks
+        self.endResetModel()
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
+        APP_DIR.mkdir(exist_ok=True)
         self.setWindowTitle("EcoG Qt Media Player")
         self.resize(1100, 720)
 
         # widgets
         self.library = LibraryPanel()
         self.player = PlayerWidget()
-        self.tracks_list = QListWidget()
+        self.tracks_model = TrackListModel(self)
+        self.tracks_list = QListView()
+        self.tracks_list.setModel(self.tracks_model)
+        self.tracks_list.setUniformItemSizes(True)
 
         # layout
         right = QWidget()
@@ -428,6 +766,7 @@ class MainWindow(QMainWindow):
 
         # data
         self.library_index: list[Track] = []
+        self._search_columns: dict[str, list[str]] = {"artist": [], "title": [], "album": []}
         self.playlists = self.load_json(PLAYLISTS_FILE, default={"playlists":[]})
         self.settings  = self.load_json(SETTINGS_FILE, default={"crossfade":6})
 
@@ -437,25 +776,30 @@ class MainWindow(QMainWindow):
         self.library.request_load_playlist.connect(self.load_playlist_by_id)
         self.library.request_save_playlist.connect(self.save_current_playlist)
         self.player.request_reveal.connect(self.reveal_path)
-        self.tracks_list.itemActivated.connect(self.play_from_selection)
+        self.tracks_list.activated.connect(self.play_from_selection)
 
         self.refresh_playlists()
         self.player.crossfade_seconds = int(self.settings.get("crossfade", 6))
         self.player.fade_slider.setValue(self.player.crossfade_seconds)
 
-        self._current_search_results: list[Track] = []
+        self.library_db = open_library_db()
+        self.player.silence_scan_db = self.settings.get("silence_db", -46)
+        self.player.silence_scan_ms = int(self.settings.get("silence_ms", 100))
+        self.player.silence_scan_step = self.settings.get("silence_seek_ms")
+        self.player.silence_large_files = bool(self.settings.get("silence_large_files", False))
+        self.player.silences_ready.connect(self.store_silences)
 
     def load_json(self, path: Path, default):
         try:
             if path.exists():
-                return json.loads(path.read_text(encoding="utf-8"))
+                return loads(path.read_bytes())
         except Exception:
             pass
         return default
 
     def save_json(self, path: Path, obj):
         try:
-            path.write_text(json.dumps(obj, indent=2), encoding="utf-8")
+            path.write_bytes(dumps(obj))
         except Exception:
             pass
 
@@ -464,53 +808,92 @@ class MainWindow(QMainWindow):
         if not dirs.isLocalFile():
             return
         base = Path(dirs.toLocalFile())
-        count = 0
+        silence_db = self.settings.get("silence_db", -46)
+        silence_ms = int(self.settings.get("silence_ms", 100))
+        db = self.library_db
+        # Unchanged files come straight from the cache; only the rest are read
         idx: list[Track] = []
-        for root, _, files in os.walk(base):
-            for f in files:
-                p = Path(root)/f
-                if p.suffix.lower() in AUDIO_EXTS:
-                    track = read_metadata(p)
-                    track.silences = analyze_silences(
-                        str(p),
-                        threshold_db = self.settings.get("silence_db", -46),
-                        min_silence_ms = int(self.settings.get("silence_ms", 100))
-                    )
-                    idx.append(track)
-                    count += 1
-        self.library_index = idx
+        misses = []  # (position in idx, path, stat)
+        for e in iter_audio_files(base):
+            p = Path(e.path)
+            try:
+                st = e.stat()
+            except OSError:
+                continue
+            row = db.execute(
+                "SELECT title, artist, album, duration, cover_path, silences, "
+                "silence_db, silence_ms FROM tracks WHERE path=? AND mtime=? AND size=?",
+                (str(p), st.st_mtime, st.st_size)
+            ).fetchone()
+            if row:
+                title, artist, album, duration, cover_path, silences, sdb, sms = row
+                if silences is None or (sdb, sms) != (silence_db, silence_ms):
+                    silences = "null"
+                idx.append(Track(str(p), title, artist, album, duration, cover_path,
+                                 json.loads(silences)))
+            else:
+                misses.append((len(idx), p, st))
+                idx.append(None)
+        # Metadata reads are independent, I/O-bound and release the GIL while
+        # waiting on disk, so threads suffice; silences are left to
+        # PlayerWidget, which analyses them lazily when a track comes up,
+        # unless a moved copy (same quickhash) already has them
+        rows = []
+        self.library.btn_scan.setEnabled(False)
+        try:
+            with ThreadPoolExecutor(max_workers=8, initializer=_open_scan_reader,
+                                    initargs=(LIBRARY_DB,)) as ex:
+                results = ex.map(read_new_file, [m[1] for m in misses], [m[2] for m in misses],
+                                 repeat(silence_db), repeat(silence_ms))
+                for done, ((pos, p, st), (track, qh, silences)) in enumerate(zip(misses, results), 1):
+                    if silences is not None:
+                        track.silences = json.loads(silences)
+                    idx[pos] = track
+                    rows.append((str(p), st.st_mtime, st.st_size, silence_db, silence_ms,
+                                 track.title, track.artist, track.album, track.duration,
+                                 track.cover_path, silences, qh))
+                    if done % 8 == 0:
+                        self.library.status.setText(f"Scanning {done}/{len(misses)}…")
+                        QApplication.processEvents()
+        finally:
+            self.library.btn_scan.setEnabled(True)
+        # One transaction for the whole batch of new rows
+        with db:
+            db.executemany("INSERT OR REPLACE INTO tracks VALUES (?,?,?,?,?,?,?,?,?,?,?,?)", rows)
+        count = len(idx)
+        self.set_library(idx)
         self.library.status.setText(f"Scanned {count} files in {base}")
         self.show_tracks(idx)
 
+    def set_library(self, tracks: list[Track]):
+        self.library_index = tracks
+        # Lowercased once per scan so searches are a plain substring test
+        self._search_columns = {
+            col: [(getattr(t, col, "") or "").lower() for t in tracks]
+            for col in ("artist", "title", "album")
+        }
+
+    def store_silences(self, path: str, silences: list):
+        with self.library_db:
+            self.library_db.execute(
+                "UPDATE tracks SET silences=?, silence_db=?, silence_ms=? WHERE path=?",
+                (json.dumps(silences), self.player.silence_scan_db, self.player.silence_scan_ms, path)
+            )
+
     def show_tracks(self, tracks: list[Track]):
-        self.tracks_list.clear()
-        for t in tracks:
-            item = QListWidgetItem(f"{t.artist or 'Unknown Artist'} — {t.title} ({t.album})")
-            item.setData(Qt.UserRole, t)
-            self.tracks_list.addItem(item)
+        self.tracks_model.set_tracks(tracks)
 
     def search_tracks(self, column: str, query: str):
         q = query.lower()
-        results = []
-        for t in self.library_index:
-            value = getattr(t, column, "") or ""
-            if q in str(value).lower():
-                results.append(t)
-        self._current_search_results = results
+        results = [t for t, value in zip(self.library_index, self._search_columns[column]) if q in value]
         self.show_tracks(results)
 
         if results:
             self.player.set_playlist(results, start_index=0)
 
-    def play_from_selection(self, item: QListWidgetItem):
-        t = item.data(Qt.UserRole)
-        if t is None: return
-        tracks = self._current_search_results or self.library_index
-        idx = 0
-        for i, tr in enumerate(tracks):
-            if tr.path == t.path:
-                idx = i; break
-        self.player.set_playlist(tracks, start_index=idx)
+    def play_from_selection(self, index: QtCore.QModelIndex):
+        if not index.isValid(): return
+        self.player.set_playlist(self.tracks_model.tracks, start_index=index.row())
 
     def refresh_playlists(self):
         self.library.playlists.clear()
@@ -524,7 +907,7 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Playlists", "No current queue to save.")
             return
         pid = str(int(QtCore.QDateTime.currentMSecsSinceEpoch()))
-        rec = {"id": pid, "name": name, "tracks":[asdict(t) for t in self.player.playlist]}
+        rec = {"id": pid, "name": name, "tracks":[track_to_json(t) for t in self.player.playlist]}
         self.playlists.setdefault("playlists", []).append(rec)
         self.save_json(PLAYLISTS_FILE, self.playlists)
         self.refresh_playlists()
@@ -532,17 +915,21 @@ class MainWindow(QMainWindow):
     def load_playlist_by_id(self, pid: str):
         for pl in self.playlists.get("playlists", []):
             if pl["id"] == pid:
-                tracks = [Track(**t) for t in pl["tracks"]]
+                tracks = [track_from_json(t) for t in pl["tracks"]]
                 self.player.set_playlist(tracks, start_index=0)
                 return
 
     def reveal_path(self, path: str):
-        if sys.platform.startswith("win"):
-            os.startfile(os.path.dirname(path))
-        elif sys.platform == "darwin":
-            os.system(f'open -R "{path}"')
-        else:
-            os.system(f'xdg-open "{os.path.dirname(path)}"')
+        # argv lists, no shell: quotes in file names cannot break the command
+        try:
+            if sys.platform.startswith("win"):
+                os.startfile(os.path.dirname(path))
+            elif sys.platform == "darwin":
+                subprocess.Popen(["open", "-R", path])
+            else:
+                subprocess.Popen(["xdg-open", os.path.dirname(path)], start_new_session=True)
+        except OSError:
+            QMessageBox.information(self, "Reveal in Folder", os.path.dirname(path))
 
 def main():
     app = QApplication(sys.argv)